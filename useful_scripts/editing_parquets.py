@@ -5,7 +5,6 @@ import os
 import pathlib
 import shutil
 
-import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 
@@ -34,21 +33,36 @@ def _safe_mkdir(relative_path: str) -> None:
 
 def create_catchment_parquet():
     """
-    Uses a pandas dataframe to create a new parquet file.
+    Builds an arrow table with an explicit schema and writes it to a new parquet file.
     """
-    catchment_df = pd.DataFrame(
+    schema = pa.schema(
+        [
+            ("lat_id", pa.int64()),
+            ("lon_id", pa.int64()),
+            ("peril_id", pa.dictionary(pa.int32(), pa.string())),
+            ("return_period", pa.int32()),
+            ("flood_depth_cm", pa.int32()),
+        ]
+    )
+    table = pa.table(
         {
             "lat_id": [184065, 184065],
             "lon_id": [-13481, -13480],
             "peril_id": ["ORF", "ORF"],
             "return_period": [20, 20],
             "flood_depth_cm": [85, 57],
-        }
+        },
+        schema=schema,
     )
 
-    table = pa.Table.from_pandas(catchment_df)
     dir_path = _get_absolute_path_from_relative_path("output")
-    pq.write_table(table, f"{dir_path}/catchment_290.parquet")
+    pq.write_table(
+        table,
+        f"{dir_path}/catchment_290.parquet",
+        compression="zstd",
+        use_dictionary=["peril_id"],
+        write_statistics=True,
+    )
 
 
 def main():
@@ -2,6 +2,8 @@ import os
 import sys
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 
 def generate_wet_area_pickle(output_dir: str):
@@ -26,20 +28,21 @@ def generate_wet_area_parquet(output_dir: str):
     Generates wet_area_peril.parquet from the provided catchments dir
     and wet_area_peril.pickle into given output dir
     """
-    wet_area_df = pd.DataFrame()
-
     if not os.path.isdir(output_dir):
         raise IOError("Output directory doesn't exist.")
 
-    wet_area_dict = {
-        "lat_id": [191322],
-        "lon_id": [-4197],
-        "peril_id": ["OSF"],
-    }
-    wet_area_df = pd.DataFrame(data=wet_area_dict)
-    print(wet_area_df.to_string())
-
-    wet_area_df.to_parquet(f"{output_dir}/wet_area_peril.parquet")
+    wet_area_table = pa.table(
+        {
+            "lat_id": pa.array([191322], type=pa.int64()),
+            "lon_id": pa.array([-4197], type=pa.int64()),
+            "peril_id": pa.array(["OSF"], type=pa.dictionary(pa.int32(), pa.string())),
+        }
+    )
+    print(wet_area_table.to_string(preview_cols=10))
+
+    pq.write_table(
+        wet_area_table, f"{output_dir}/wet_area_peril.parquet", compression="zstd"
+    )
 
 
 # if __name__ == "__main__":